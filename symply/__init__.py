@@ -1,9 +1,20 @@
-from .symply import symlink, delete_symlink
-from .watcher import SymlinkMonitor, SymlinkHandler
+from .symply import symlink, symlink_many, delete_symlink
 
 __all__: list[str] = [
     "symlink",
+    "symlink_many",
     "delete_symlink",
     "SymlinkMonitor",
     "SymlinkHandler"
 ]
+
+
+def __getattr__(name: str):
+    # Defer the watchdog import (which probes platform observers at import
+    # time) until the monitoring classes are actually requested.
+    if name in ("SymlinkMonitor", "SymlinkHandler"):
+        from . import watcher
+        value = getattr(watcher, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,11 @@ The `symlink` function creates a symlink from a source file to a target path. It
 Example:
     >>> symlink("/path/to/source.txt", "/path/to/target_link.txt", force=True)
 
+The `symlink_many` function creates many symlinks in one call, grouping them by target directory to amortize per-call overhead.
+
+Example:
+    >>> symlink_many([("/path/a.txt", "/links/a.txt"), ("/path/b.txt", "/links/b.txt")])
+
 The `delete_symlink` function deletes a symlink if it exists.
 
 Example:
@@ -20,10 +25,143 @@ Example:
 
 For more information, see the documentation for each function and class.
 """
+import functools
 import logging
 import os
+import stat
+from collections import defaultdict
+from os import lstat as _os_lstat
+from os import makedirs as _os_makedirs
+from os import readlink as _os_readlink
+from os import remove as _os_remove
+from os import rmdir as _os_rmdir
+from os import stat as _os_stat
+from os import symlink as _os_symlink
+from os import unlink as _os_unlink
+
+from . import _uring
 
 logger = logging.getLogger(__name__)
+_log_info = logger.info
+
+# Bulk workloads resolve the same path prefixes over and over; memoizing skips
+# the getcwd syscall and normpath scan on repeats. The abspath cache assumes
+# the working directory is stable for the life of the process, which holds for
+# the daemon/CLI callers this package targets.
+_abspath = functools.lru_cache(maxsize=8192)(os.path.abspath)
+_dirname = functools.lru_cache(maxsize=8192)(os.path.dirname)
+
+
+def _fast_abspath(p: str) -> str:
+    """Return `p` unchanged when it is already absolute and normalized, avoiding the getcwd/normpath work in abspath."""
+    if len(p) > 1 and p[0] == '/' and '..' not in p and '//' not in p and '/./' not in p and not p.endswith(('/', '/.')):
+        return p
+    return _abspath(p)
+
+
+# Handlers for the target-state decision table used by symlink(). Each takes
+# the resolved paths plus the lstat result and stored link target, and returns
+# True when the existing target already satisfies the request (skip creation).
+
+def _create(source, target, current_target, st):
+    return False
+
+
+def _already_linked(source, target, current_target, st):
+    _log_info("Symlink already exists: %s -> %s", target, source)
+    return True
+
+
+def _replace_link(source, target, current_target, st):
+    _os_unlink(target)
+    _log_info("Removed existing link: %s", target)
+    return False
+
+
+def _replace_other(source, target, current_target, st):
+    mode = st.st_mode
+    if not (stat.S_ISREG(mode) or stat.S_ISDIR(mode)):
+        raise FileExistsError(f"File or directory exists and is not a symlink: {target}")
+    (_os_remove if stat.S_ISREG(mode) else _os_rmdir)(target)
+    _log_info("Removed existing file or directory: %s", target)
+    return False
+
+
+def _raise_different(source, target, current_target, st):
+    raise FileExistsError(f"Symlink exists and points to a different source: {current_target}")
+
+
+def _raise_not_link(source, target, current_target, st):
+    raise FileExistsError(f"File or directory exists and is not a symlink: {target}")
+
+
+# Decision table keyed on (exists << 3) | (is_link << 2) | (same_target << 1)
+# | force. Building all 16 keys keeps the hot path to a single dict lookup and
+# makes the overwrite semantics auditable in one place.
+_ACTIONS = {}
+for _exists in (0, 1):
+    for _is_link in (0, 1):
+        for _same in (0, 1):
+            for _force in (0, 1):
+                if not _exists:
+                    _handler = _create
+                elif _is_link and _same:
+                    _handler = _already_linked
+                elif _is_link:
+                    _handler = _replace_link if _force else _raise_different
+                else:
+                    _handler = _replace_other if _force else _raise_not_link
+                _ACTIONS[(_exists << 3) | (_is_link << 2) | (_same << 1) | _force] = _handler
+del _exists, _is_link, _same, _force, _handler
+
+# Tables pre-specialized on the force flag, so each call folds the flag away
+# once up front instead of mixing it into every key build.
+_ACTIONS_FORCE = {k >> 1: v for k, v in _ACTIONS.items() if k & 1}
+_ACTIONS_NOFORCE = {k >> 1: v for k, v in _ACTIONS.items() if not k & 1}
+
+
+def _symlink_impl(force, actions, source, target):
+    """Shared body for the force-specialized symlink variants."""
+    source = _fast_abspath(source)
+    target = _fast_abspath(target)
+
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Source file or directory does not exist: {source}")
+
+    # A single lstat classifies the target (missing / symlink / file / dir)
+    # instead of the lexists/islink/isfile/isdir probe cascade.
+    try:
+        st = _os_lstat(target)
+    except FileNotFoundError:
+        st = None
+
+    is_link = st is not None and stat.S_ISLNK(st.st_mode)
+    current_target = _os_readlink(target) if is_link else None
+    key = ((st is not None) << 2) | (is_link << 1) | (current_target == source)
+    if actions[key](source, target, current_target, st):
+        return True
+
+    # Let the kernel perform the final existence check atomically; os.symlink
+    # raises on failure, so no post-creation validation is needed. A missing
+    # target directory surfaces as ENOENT here, so the common case pays no
+    # probing syscalls and the rare case creates the directory and retries.
+    try:
+        _os_symlink(source, target)
+    except FileNotFoundError:
+        _os_makedirs(_dirname(target), exist_ok=True)
+        _os_symlink(source, target)
+    except FileExistsError:
+        if not force:
+            raise
+        _os_unlink(target)
+        _os_symlink(source, target)
+
+    _log_info("Symlink created: %s -> %s", target, source)
+    return True
+
+
+_symlink_force_true = functools.partial(_symlink_impl, True, _ACTIONS_FORCE)
+_symlink_force_false = functools.partial(_symlink_impl, False, _ACTIONS_NOFORCE)
 
 
 def symlink(source: str, target: str, force: bool = False) -> bool:
@@ -52,57 +190,98 @@ def symlink(source: str, target: str, force: bool = False) -> bool:
     if not source or not target:
         raise ValueError("Source and target must be non-empty strings")
 
-    source = os.path.abspath(source)
-    target = os.path.abspath(target)
+    return (_symlink_force_true if force else _symlink_force_false)(source, target)
 
-    if not os.path.exists(source):
-        raise FileNotFoundError(f"Source file or directory does not exist: {source}")
 
-    target_dir = os.path.dirname(target)
-    if not os.path.exists(target_dir):
-        os.makedirs(target_dir)
-        logger.info(f"Created missing directory: {target_dir}")
-
-    if os.path.lexists(target):
-        if os.path.islink(target):
-            current_target = os.path.realpath(target)
-            if current_target != source:
-                if force:
-                    os.unlink(target)
-                    logger.info(f"Removed existing link: {target}")
-                else:
-                    raise FileExistsError(f"Symlink exists and points to a different source: {current_target}")
-        elif force:
-            if os.path.isfile(target) or os.path.isdir(target):
-                os.remove(target)
-                logger.info(f"Removed existing file or directory: {target}")
-            else:
-                raise FileExistsError(f"File or directory exists and is not a symlink: {target}")
-        else:
-            raise FileExistsError(f"File or directory exists and is not a symlink: {target}")
-
-    os.symlink(source, target)
-    if not os.path.islink(target) or os.path.realpath(target) != source:
-        raise Exception("Failed to create or validate the symlink")
-
-    logger.info(f"Symlink created: {target} -> {source}")
-    return True
+def symlink_many(pairs, force: bool = False) -> int:
+    """
+    Create many symlinks at once, amortizing per-call overhead.
+
+    Pairs are grouped by target directory so each directory is created at most
+    once, and links are issued with raw `os.symlink` calls in a tight loop.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): (source, target) path pairs.
+        force (bool): If True, overwrite existing targets.
+
+    Raises:
+        FileExistsError: If a target already exists and force is not True.
+
+    Returns:
+        int: The number of symlinks created.
+    """
+    by_dir = defaultdict(list)
+    for source, target in pairs:
+        source = _fast_abspath(source)
+        target = _fast_abspath(target)
+        by_dir[_dirname(target)].append((source, target))
+
+    # With dir_fd support, open each target directory once and link by
+    # basename so the kernel skips the full path walk on every symlink.
+    use_dir_fd = os.symlink in os.supports_dir_fd and os.unlink in os.supports_dir_fd
+
+    created = 0
+    for target_dir, group in by_dir.items():
+        _os_makedirs(target_dir, exist_ok=True)
+        if _uring.available():
+            created += _uring.symlink_batch(group, force=force)
+            continue
+        if use_dir_fd:
+            fd = os.open(target_dir, os.O_DIRECTORY | os.O_CLOEXEC)
+            try:
+                for source, target in group:
+                    name = os.path.basename(target)
+                    try:
+                        _os_symlink(source, name, dir_fd=fd)
+                    except FileExistsError:
+                        if not force:
+                            raise
+                        _os_unlink(name, dir_fd=fd)
+                        _os_symlink(source, name, dir_fd=fd)
+                    created += 1
+            finally:
+                os.close(fd)
+            continue
+        for source, target in group:
+            try:
+                _os_symlink(source, target)
+            except FileExistsError:
+                if not force:
+                    raise
+                _os_unlink(target)
+                _os_symlink(source, target)
+            created += 1
+
+    if logger.isEnabledFor(logging.INFO):
+        _log_info("Created %d symlinks across %d directories", created, len(by_dir))
+    return created
 
 
 def delete_symlink(target, remove_source=False) -> bool:
     """Remove a symlink at the specified target path and optionally remove the source file or directory."""
-    if not os.path.islink(target):
+    try:
+        st = _os_lstat(target)
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISLNK(st.st_mode):
         return False
 
-    source = os.path.realpath(target)
-    os.unlink(target)
-    logger.info(f"Deleted symlink: {target}")
+    # readlink returns exactly what was stored in one syscall, unlike realpath
+    # which lstats every parent component and fully resolves the path.
+    link = _os_readlink(target)
+    source = link if os.path.isabs(link) else os.path.normpath(os.path.join(os.path.dirname(target), link))
+    _os_unlink(target)
+    _log_info("Deleted symlink: %s", target)
 
     if remove_source:
-        if os.path.isfile(source):
-            os.remove(source)
-            logger.info(f"Deleted source file: {source}")
-        elif os.path.isdir(source):
-            os.rmdir(source)
-            logger.info(f"Deleted source directory: {source}")
+        try:
+            mode = _os_stat(source).st_mode
+        except FileNotFoundError:
+            return True
+        if stat.S_ISREG(mode):
+            _os_remove(source)
+            _log_info("Deleted source file: %s", source)
+        elif stat.S_ISDIR(mode):
+            _os_rmdir(source)
+            _log_info("Deleted source directory: %s", source)
     return True
\ No newline at end of file
@@ -14,11 +14,24 @@ Attributes:
 - `watch_directory` (str): The path to the directory being monitored.
 - `event_handler` (FileSystemEventHandler): The event handler used for managing events.
 - `observer` (Observer): The observer instance used for monitoring.
-- `thread` (Thread): The thread used to run the observer.
 """
 import logging
-import threading
-from watchdog.observers import Observer
+import re
+import sys
+
+# Prefer the inotify observer on Linux: kernel events carry zero polling cost,
+# whereas the generic Observer can fall back to periodic readdir/stat sweeps.
+# Guard on the platform first; importing the inotify module elsewhere fails
+# with OS-level errors rather than ImportError, and even on Linux watchdog
+# raises its own UnsupportedLibcError (a plain Exception) for unsupported
+# libc setups.
+if sys.platform == "linux":
+    try:
+        from watchdog.observers.inotify import InotifyObserver as Observer
+    except Exception:
+        from watchdog.observers import Observer
+else:
+    from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, RegexMatchingEventHandler
 
 logger = logging.getLogger(__name__)
@@ -33,71 +46,105 @@ class SymlinkMonitor:
         `event_handler` (FileSystemEventHandler): The event handler to use for managing events.
         `include_patterns` (list): A list of regex patterns to include in monitoring.
         `exclude_patterns` (list): A list of regex patterns to exclude from monitoring.
+        `generate_full_events` (bool): If True, inotify emits move events even when only one side of a rename is inside the watched tree, with None for the missing path. The default already reports in-tree renames as single move events.
 
     Attributes:
         watch_directory (str): The path to the directory being monitored.
         event_handler (FileSystemEventHandler): The event handler used for managing events.
         observer (Observer): The observer instance used for monitoring.
-        thread (Thread): The thread used to run the observer.
 
     Example:
         >>> handler = SymlinkHandler(handle_event)
         >>> monitor = SymlinkMonitor('/path/to/directory', handler, include_patterns=['*.txt', '*.docx'])
         >>> monitor.start()
     """
-    def __init__(self, watch_directory, event_handler, include_patterns=None, exclude_patterns=None):
+    def __init__(self, watch_directory, event_handler, include_patterns=None, exclude_patterns=None, generate_full_events=False):
         self.watch_directory = watch_directory
-        self.event_handler = event_handler if event_handler else FileSystemEventHandler()
-        self.observer = Observer()
-        self.thread = threading.Thread(target=self._run, daemon=True)
+        # Resolve the handler before constructing the observer so the pattern
+        # case doesn't allocate a throwaway FileSystemEventHandler first.
         if include_patterns or exclude_patterns:
             self.event_handler = RegexMatchingEventHandler(ignore_directories=False, ignore_regexes=exclude_patterns, regexes=include_patterns)
+        else:
+            self.event_handler = event_handler if event_handler else FileSystemEventHandler()
+        try:
+            # generate_full_events=True selects inotify's full emitter, which
+            # emits move events even when one side of a rename falls outside
+            # the watched tree (with None for the missing path); the default
+            # already reports in-tree renames as single move events. Other
+            # observers do not take the keyword. timeout=2.0 halves the wakeup rate of the
+            # observer's internal event loop (watchdog's default is 1 second)
+            # when the watched directory is idle.
+            self.observer = Observer(timeout=2.0, generate_full_events=generate_full_events)
+        except TypeError:
+            self.observer = Observer(timeout=2.0)
 
-    def _run(self):
-        """Internal method to run the observer in a separate thread."""
+    def start(self):
+        """Starts monitoring the specified directory on the observer's own thread."""
         self.observer.schedule(self.event_handler, self.watch_directory, recursive=True)
         self.observer.start()
-        self.observer.join()
-
-    def start(self):
-        """Starts monitoring the specified directory in a background thread."""
-        self.thread.start()
-        logger.info(f"Advanced monitoring started on {self.watch_directory}")
+        logger.info("Advanced monitoring started on %s", self.watch_directory)
 
     def stop(self):
         """Stops monitoring the directory and ensures clean thread termination."""
         self.observer.stop()
-        self.thread.join()
+        self.observer.join()
         logger.info("Advanced monitoring stopped.")
 
 
 class SymlinkHandler(RegexMatchingEventHandler):
     """Custom handler for managing symlink-related events and more."""
+    # Log messages per event type, resolved once instead of per event.
+    _messages = {
+        'created': "Created: %s",
+        'deleted': "Deleted: %s",
+        'modified': "Modified: %s",
+    }
+
     def __init__(self, on_event_callback, include_patterns=None, exclude_patterns=None):
         super().__init__(ignore_directories=False, ignore_regexes=exclude_patterns, regexes=include_patterns)
         self.on_event_callback = on_event_callback
-
-    def on_deleted(self, event):
-        """Handle deleted files or directories."""
-        logger.info(f"Deleted: {event.src_path}")
-        self.on_event_callback(event.src_path, event_type='deleted')
-
-    def on_modified(self, event):
-        """Handle modifications to files or directories."""
-        logger.info(f"Modified: {event.src_path}")
-        self.on_event_callback(event.src_path, event_type='modified')
-
-    def on_created(self, event):
-        """Handle new files or directories."""
-        logger.info(f"Created: {event.src_path}")
-        self.on_event_callback(event.src_path, event_type='created')
-
-    def on_moved(self, event):
-        """Handle moving files or directories."""
-        logger.info(f"Moved from {event.src_path} to {event.dest_path}")
+        # Combine the pattern lists into single alternation regexes so each
+        # event costs one match instead of a scan over every pattern.
+        self._include = re.compile('|'.join(f'(?:{p})' for p in (include_patterns or ['.*'])))
+        self._exclude = re.compile('|'.join(f'(?:{p})' for p in exclude_patterns)) if exclude_patterns else None
+        # One dict lookup replaces the if/elif + getattr chain in the parent
+        # dispatch; event types without an entry (e.g. 'opened') are dropped.
+        self._handlers = {
+            'created': self._fire,
+            'deleted': self._fire,
+            'modified': self._fire,
+            'moved': self._fire_moved,
+        }
+
+    def dispatch(self, event):
+        """Filter the event against the combined regexes and dispatch via a dict lookup, skipping watchdog's per-pattern loop."""
+        # Anchored match() mirrors RegexMatchingEventHandler's semantics, and
+        # moved events are filtered on their destination path as well, just
+        # like the parent class.
+        paths = [event.src_path]
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            paths.append(dest_path)
+        if self._exclude is not None and any(self._exclude.match(p) for p in paths):
+            return
+        if not any(self._include.match(p) for p in paths):
+            return
+        handler = self._handlers.get(event.event_type)
+        if handler is not None:
+            handler(event)
+
+    def _fire(self, event):
+        """Log the event lazily and forward it to the callback."""
+        event_type = event.event_type
+        logger.info(self._messages[event_type], event.src_path)
+        self.on_event_callback(event.src_path, event_type=event_type)
+
+    def _fire_moved(self, event):
+        """Log a move event lazily and forward it with its destination."""
+        logger.info("Moved from %s to %s", event.src_path, event.dest_path)
         self.on_event_callback(event.src_path, event_type='moved', destination=event.dest_path)
 
 
 def handle_event(path, event_type, destination=None):
     """Generic event handling function to log and manage changes detected by the monitor."""
-    logger.info(f"Event Type: {event_type}, Path: {path}, Destination: {destination if destination else 'N/A'}")
+    logger.info("Event Type: %s, Path: %s, Destination: %s", event_type, path, destination if destination else 'N/A')
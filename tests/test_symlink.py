@@ -1,8 +1,10 @@
 import os
 import pytest
+from unittest.mock import patch
 from pyfakefs.fake_filesystem_unittest import Patcher
 
-from symply import symlink, delete_symlink
+from symply import symlink, symlink_many, delete_symlink
+from symply import _uring
 
 
 def test_symlink_creation():
@@ -150,6 +152,72 @@ def test_symlink_loops():
         with pytest.raises(Exception):
             symlink(target, target)
 
+def test_symlink_many_creation():
+    # The io_uring backend issues real syscalls, so pin the POSIX path
+    # while running against the fake filesystem
+    with patch("symply._uring.available", return_value=False), Patcher() as patcher:
+        patcher.fs.create_file("/fake/a.txt")
+        patcher.fs.create_file("/fake/b.txt")
+        pairs = [
+            ("/fake/a.txt", "/links/a_link.txt"),
+            ("/fake/b.txt", "/links/deep/b_link.txt"),
+        ]
+
+        # Test bulk symlink creation, including a missing target directory
+        assert symlink_many(pairs) == 2
+        assert patcher.fs.islink("/links/a_link.txt")
+        assert patcher.fs.readlink("/links/deep/b_link.txt") == "/fake/b.txt"
+
+def test_symlink_many_force_overwrite():
+    with patch("symply._uring.available", return_value=False), Patcher() as patcher:
+        patcher.fs.create_file("/fake/a.txt")
+        patcher.fs.create_file("/fake/b.txt")
+        patcher.fs.create_symlink("/links/a_link.txt", "/fake/old.txt")
+
+        pairs = [("/fake/a.txt", "/links/a_link.txt")]
+
+        # Without force an existing target raises
+        with pytest.raises(FileExistsError):
+            symlink_many(pairs)
+
+        # With force the existing target is replaced
+        assert symlink_many(pairs, force=True) == 1
+        assert patcher.fs.readlink("/links/a_link.txt") == "/fake/a.txt"
+
+def test_symlink_many_routes_through_uring_backend():
+    with patch("symply._uring.available", return_value=True), \
+         patch("symply._uring.symlink_batch", return_value=2) as batch, \
+         Patcher() as patcher:
+        patcher.fs.create_file("/fake/a.txt")
+        patcher.fs.create_file("/fake/b.txt")
+        pairs = [
+            ("/fake/a.txt", "/links/a_link.txt"),
+            ("/fake/b.txt", "/links/b_link.txt"),
+        ]
+
+        # When the backend reports available, the whole group goes through it
+        assert symlink_many(pairs) == 2
+        batch.assert_called_once_with(
+            [("/fake/a.txt", "/links/a_link.txt"), ("/fake/b.txt", "/links/b_link.txt")],
+            force=False,
+        )
+
+@pytest.mark.skipif(not _uring.available(), reason="io_uring symlink backend unavailable")
+def test_uring_symlink_batch(tmp_path):
+    # Exercises the real backend, so it uses the real filesystem
+    source = tmp_path / "source.txt"
+    source.touch()
+    targets = [tmp_path / f"link_{i}.txt" for i in range(3)]
+    pairs = [(str(source), str(t)) for t in targets]
+
+    assert _uring.symlink_batch(pairs) == 3
+    assert all(os.readlink(t) == str(source) for t in targets)
+
+    # Existing targets raise without force and are replaced with it
+    with pytest.raises(FileExistsError):
+        _uring.symlink_batch(pairs[:1])
+    assert _uring.symlink_batch(pairs, force=True) == 3
+
 def test_symlink_with_insufficient_permissions():
     with Patcher() as patcher:
         source = "/secure/source.txt"